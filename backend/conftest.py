@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+
+
+@pytest.fixture(scope="session")
+def pyproject_data() -> dict[str, Any]:
+    """backend/pyproject.toml read and parsed once for the whole session."""
+    # Imported lazily: tomllib drags in re machinery that every collection-only
+    # run would otherwise pay for, and only this fixture needs it.
+    import tomllib
+
+    return tomllib.loads(BACKEND_DIR.joinpath("pyproject.toml").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def uv_lock_text() -> str:
+    """backend/uv.lock read once for the whole session."""
+    return BACKEND_DIR.joinpath("uv.lock").read_text(encoding="utf-8")
@@ -8,7 +8,7 @@ from models.constants import DEFAULT_DURATION_SECONDS
 QueueItemStatus = Literal["queued", "generating", "completed", "failed"]
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationQueueItem:
     id: str
     prompt: str
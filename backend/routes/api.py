@@ -28,25 +28,29 @@ from repositories import media_repository
 router = APIRouter()
 
 _MULTIPART_BOUNDARY = "reelpod"
+_MULTIPART_SEP = f"--{_MULTIPART_BOUNDARY}\r\n".encode()
+_MULTIPART_CLOSE = f"--{_MULTIPART_BOUNDARY}--\r\n".encode()
+_MULTIPART_MEDIA_TYPE = f"multipart/mixed; boundary={_MULTIPART_BOUNDARY}"
+
+# Fully static fragments prepacked once; only the metadata JSON and the mp4
+# payload vary per response.
+_MULTIPART_JSON_PART_HEAD = _MULTIPART_SEP + b"Content-Type: application/json\r\n\r\n"
+_MULTIPART_MP4_PART_HEAD = b"\r\n" + _MULTIPART_SEP + b"Content-Type: video/mp4\r\n\r\n"
+_MULTIPART_TAIL = b"\r\n" + _MULTIPART_CLOSE
 
 
 def _build_multipart_response(mp4_bytes: bytes, metadata: dict[str, str]) -> Response:
     meta_json = json_lib.dumps(metadata).encode()
-    sep = f"--{_MULTIPART_BOUNDARY}\r\n".encode()
     body = (
-        sep
-        + b"Content-Type: application/json\r\n\r\n"
+        _MULTIPART_JSON_PART_HEAD
         + meta_json
-        + b"\r\n"
-        + sep
-        + b"Content-Type: video/mp4\r\n\r\n"
+        + _MULTIPART_MP4_PART_HEAD
         + mp4_bytes
-        + b"\r\n"
-        + f"--{_MULTIPART_BOUNDARY}--\r\n".encode()
+        + _MULTIPART_TAIL
     )
     return Response(
         content=body,
-        media_type=f"multipart/mixed; boundary={_MULTIPART_BOUNDARY}",
+        media_type=_MULTIPART_MEDIA_TYPE,
     )
 
 
@@ -112,8 +112,10 @@ def _queue_worker() -> None:
     while not queue_stop_event.is_set():
         next_item_id: str | None = None
         with queue_condition:
+            # No timed polling: enqueue_generation_request and stop_queue_worker
+            # both notify under the condition, so a plain wait wakes immediately.
             while not queue_stop_event.is_set() and not queue_order:
-                queue_condition.wait(timeout=0.1)
+                queue_condition.wait()
 
             if queue_stop_event.is_set():
                 return
@@ -173,11 +175,12 @@ def ensure_queue_worker_running() -> None:
 
 def stop_queue_worker() -> None:
     global queue_worker_thread
+    if queue_worker_thread is None:
+        return
     queue_stop_event.set()
     with queue_condition:
         queue_condition.notify_all()
-    if queue_worker_thread is not None:
-        queue_worker_thread.join(timeout=1.0)
+    queue_worker_thread.join(timeout=1.0)
     queue_worker_thread = None
 
 
@@ -4,7 +4,6 @@ import json
 import logging
 import os
 import random
-import re
 import sys
 from pathlib import Path
 from typing import Any
@@ -24,6 +23,7 @@ llm_pipeline: Any | None = None
 llm_pipeline_load_error: str | None = None
 
 QUALITY_PREFIXES = ("score_9", "masterpiece", "best quality")
+_QUALITY_PREFIX_MAX_LEN = max(len(prefix) for prefix in QUALITY_PREFIXES)
 JSON_PARSE_RETRIES = 2
 
 CREATIVE_DIRECTOR_SYSTEM_PROMPT = (
@@ -53,7 +53,13 @@ CREATIVE_DIRECTOR_SYSTEM_PROMPT = (
 )
 
 
-_FILE_EXTENSION_PATTERN = re.compile(r"\.[a-zA-Z0-9]{2,4}$")
+def _ends_with_file_extension(value: str) -> bool:
+    """True when the string ends in a 2-4 char ASCII-alphanumeric extension like .mp3."""
+    dot = value.rfind(".")
+    if dot == -1:
+        return False
+    suffix = value[dot + 1 :]
+    return 2 <= len(suffix) <= 4 and suffix.isascii() and suffix.isalnum()
 
 
 class OrchestrationResult(BaseModel):
@@ -76,8 +82,10 @@ class OrchestrationResult(BaseModel):
     @field_validator("image_prompt")
     @classmethod
     def _validate_image_quality_prefix(cls, value: str) -> str:
-        lower_value = value.lower()
-        if not any(lower_value.startswith(prefix) for prefix in QUALITY_PREFIXES):
+        # Only the head of the prompt matters; lowercasing a slice avoids
+        # copying the full (up to 10k chars) prompt just to check a prefix.
+        head = value[: _QUALITY_PREFIX_MAX_LEN].lower()
+        if not head.startswith(QUALITY_PREFIXES):
             allowed = ", ".join(QUALITY_PREFIXES)
             raise ValueError(f"image_prompt must start with one of: {allowed}")
         return value
@@ -94,7 +102,7 @@ class OrchestrationResult(BaseModel):
     def _validate_youtube_title(cls, value: str) -> str:
         if "_" in value:
             raise ValueError("youtube_title must not contain underscores.")
-        if _FILE_EXTENSION_PATTERN.search(value):
+        if _ends_with_file_extension(value):
             raise ValueError("youtube_title must not end with a file extension (e.g. .mp3, .mp4).")
         return value
 
@@ -157,12 +165,17 @@ def startup() -> None:
         logger.error("LLM orchestration pipeline failed to load: %s", exc)
 
 
+# Everything around the user brief is constant, so the prompt frame is
+# assembled once at import and each request only pays one concatenation.
+_ORCHESTRATION_PROMPT_PREFIX = (
+    f"<start_of_turn>system\n{CREATIVE_DIRECTOR_SYSTEM_PROMPT}<end_of_turn>\n"
+    "<start_of_turn>user\nUser brief: "
+)
+_ORCHESTRATION_PROMPT_SUFFIX = "<end_of_turn>\n<start_of_turn>model\n"
+
+
 def _build_orchestration_prompt(user_prompt: str) -> str:
-    return (
-        f"<start_of_turn>system\n{CREATIVE_DIRECTOR_SYSTEM_PROMPT}<end_of_turn>\n"
-        f"<start_of_turn>user\nUser brief: {user_prompt.strip()}<end_of_turn>\n"
-        "<start_of_turn>model\n"
-    )
+    return _ORCHESTRATION_PROMPT_PREFIX + user_prompt.strip() + _ORCHESTRATION_PROMPT_SUFFIX
 
 
 def _extract_json_object(raw_text: str) -> dict[str, Any]:
@@ -12,10 +12,12 @@ WAV_HEADER = b"RIFF" + b"\x00" * 100
 PNG_HEADER = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
 MP4_HEADER = b"\x00\x00\x00\x20" + b"ftyp" + b"\x00" * 28
 
+_BOUNDARY_RE = re.compile(r"boundary=([^\s;]+)")
+
 
 def _extract_multipart_metadata(content: bytes, content_type: str) -> dict[str, str]:
     """Parse the JSON metadata object from a multipart/mixed response body."""
-    boundary_match = re.search(r"boundary=([^\s;]+)", content_type)
+    boundary_match = _BOUNDARY_RE.search(content_type)
     assert boundary_match, "No boundary in content-type"
     boundary = boundary_match.group(1).encode()
     # Split on the boundary marker; first real part is between parts[1] and parts[2]
@@ -157,11 +157,11 @@ def test_audio_constants_expose_separate_model_env_variables(monkeypatch: pytest
             "PYCOMFY_ACE_UNET",
         )
     }
-    monkeypatch.setenv("ACE_COMFY_DIFFUSION_MODEL", "ace-diffusion.safetensors")
-    monkeypatch.setenv("ACE_COMFY_TEXT_ENCODER", "ace-text-encoder.safetensors")
-    monkeypatch.setenv("ACE_COMFY_VAE", "ace-vae.safetensors")
-    monkeypatch.delenv("PYCOMFY_ACE_DIFFUSION_MODEL", raising=False)
-    monkeypatch.delenv("PYCOMFY_ACE_UNET", raising=False)
+    monkeypatch.setitem(os.environ, "ACE_COMFY_DIFFUSION_MODEL", "ace-diffusion.safetensors")
+    monkeypatch.setitem(os.environ, "ACE_COMFY_TEXT_ENCODER", "ace-text-encoder.safetensors")
+    monkeypatch.setitem(os.environ, "ACE_COMFY_VAE", "ace-vae.safetensors")
+    monkeypatch.delitem(os.environ, "PYCOMFY_ACE_DIFFUSION_MODEL", raising=False)
+    monkeypatch.delitem(os.environ, "PYCOMFY_ACE_UNET", raising=False)
 
     reloaded_constants = importlib.reload(audio_constants)
 
@@ -7,6 +7,8 @@ import pytest
 
 from services import credits_service
 
+MODEL_CREDITS_YAML = Path(__file__).parent / "config" / "model_credits.yaml"
+
 
 @pytest.fixture(autouse=True)
 def reset_credits_state() -> None:
@@ -60,10 +62,9 @@ class TestCreditsServiceValidYaml:
 
     def test_startup_loads_real_yaml_file(self) -> None:
         """AC01: The real model_credits.yaml file can be read and produces non-empty credits."""
-        real_path = Path(__file__).parent / "config" / "model_credits.yaml"
-        assert real_path.is_file(), "backend/config/model_credits.yaml must exist"
+        assert MODEL_CREDITS_YAML.is_file(), "backend/config/model_credits.yaml must exist"
 
-        credits_service.startup(real_path)
+        credits_service.startup(MODEL_CREDITS_YAML)
         text = credits_service.get_credits_text()
 
         assert text != "", "model_credits.yaml should produce non-empty credits text"
@@ -162,10 +163,9 @@ class TestCreditsServiceFooter:
         assert text == "Models used: ACEStep 1.5 (Music generation)"
 
     def test_real_yaml_includes_footer(self) -> None:
-        real_path = Path(__file__).parent / "config" / "model_credits.yaml"
-        assert real_path.is_file()
+        assert MODEL_CREDITS_YAML.is_file()
 
-        credits_service.startup(real_path)
+        credits_service.startup(MODEL_CREDITS_YAML)
         text = credits_service.get_credits_text()
 
         assert "Generated with ReelPod Studio" in text
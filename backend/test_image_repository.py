@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
-import urllib.error
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -21,6 +21,39 @@ class _FakeAnimaComfyPipeline:
     pass
 
 
+# Built once at import: large enough (>1 MB) to exercise the chunked download
+# progress logging without re-allocating 1.5 MB per test run.
+_DOWNLOAD_PAYLOAD = (b"abcdef" * 300_000)[:1_500_000]
+
+
+class _FakeResponse:
+    """Module-level urlopen stand-in so the class is defined once, not per test."""
+
+    __slots__ = ("_view", "_offset", "headers")
+
+    def __init__(self, payload: bytes) -> None:
+        # Hold a memoryview so per-chunk slicing stays zero-copy; bytes are
+        # only materialized when handing a chunk to the consumer.
+        self._view = memoryview(payload)
+        self._offset = 0
+        self.headers = {"Content-Length": str(len(payload))}
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+    def read(self, size: int = -1) -> bytes:
+        if self._offset >= len(self._view):
+            return b""
+        if size < 0:
+            size = len(self._view) - self._offset
+        chunk = self._view[self._offset : self._offset + size]
+        self._offset += len(chunk)
+        return chunk.tobytes()
+
+
 def _install_fake_comfy_modules(monkeypatch: pytest.MonkeyPatch) -> None:
     fake_torch = ModuleType("torch")
     fake_torch.bfloat16 = object()
@@ -78,8 +111,8 @@ def test_load_image_pipeline_returns_anima_comfy_pipeline(
 
 
 def test_load_image_pipeline_requires_models_dir(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("ANIMA_COMFY_MODELS_DIR", raising=False)
-    monkeypatch.delenv("PYCOMFY_MODELS_DIR", raising=False)
+    monkeypatch.delitem(os.environ, "ANIMA_COMFY_MODELS_DIR", raising=False)
+    monkeypatch.delitem(os.environ, "PYCOMFY_MODELS_DIR", raising=False)
     _install_fake_comfy_modules(monkeypatch)
     monkeypatch.setattr(image_repository, "_ensure_comfyui_vendor_on_path", lambda: None)
 
@@ -97,10 +130,10 @@ def test_get_realesrgan_weights_dir_uses_env_override_or_backend_default(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     env_dir = tmp_path / "env-weights"
-    monkeypatch.setenv("REAL_ESRGAN_WEIGHTS_DIR", str(env_dir))
+    monkeypatch.setitem(os.environ, "REAL_ESRGAN_WEIGHTS_DIR", str(env_dir))
     assert image_repository._get_realesrgan_weights_dir() == env_dir
 
-    monkeypatch.delenv("REAL_ESRGAN_WEIGHTS_DIR", raising=False)
+    monkeypatch.delitem(os.environ, "REAL_ESRGAN_WEIGHTS_DIR", raising=False)
     assert image_repository._get_realesrgan_weights_dir().as_posix().endswith(
         "backend/.realesrgan"
     )
@@ -113,7 +146,7 @@ def test_ensure_realesrgan_anime_weights_skips_download_when_file_exists(
     weights_dir.mkdir(parents=True, exist_ok=True)
     existing = weights_dir / constants.REAL_ESRGAN_ANIME_WEIGHTS_FILENAME
     existing.write_bytes(b"already-there")
-    monkeypatch.setenv("REAL_ESRGAN_WEIGHTS_DIR", str(weights_dir))
+    monkeypatch.setitem(os.environ, "REAL_ESRGAN_WEIGHTS_DIR", str(weights_dir))
 
     called = {"download": False}
 
@@ -130,42 +163,20 @@ def test_ensure_realesrgan_anime_weights_skips_download_when_file_exists(
 def test_ensure_realesrgan_anime_weights_downloads_missing_file_with_progress(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
-    class _FakeResponse:
-        def __init__(self, payload: bytes) -> None:
-            self._payload = payload
-            self._offset = 0
-            self.headers = {"Content-Length": str(len(payload))}
-
-        def __enter__(self) -> "_FakeResponse":
-            return self
-
-        def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-            return None
-
-        def read(self, size: int = -1) -> bytes:
-            if self._offset >= len(self._payload):
-                return b""
-            if size < 0:
-                size = len(self._payload) - self._offset
-            chunk = self._payload[self._offset : self._offset + size]
-            self._offset += len(chunk)
-            return chunk
-
     weights_dir = tmp_path / "weights"
-    monkeypatch.setenv("REAL_ESRGAN_WEIGHTS_DIR", str(weights_dir))
+    monkeypatch.setitem(os.environ, "REAL_ESRGAN_WEIGHTS_DIR", str(weights_dir))
     caplog.set_level(logging.INFO)
     seen: dict[str, Any] = {}
-    payload = (b"abcdef" * 300_000)[:1_500_000]
 
     def fake_urlopen(url: str) -> _FakeResponse:
         seen["url"] = url
-        return _FakeResponse(payload)
+        return _FakeResponse(_DOWNLOAD_PAYLOAD)
 
     monkeypatch.setattr(image_repository.urllib.request, "urlopen", fake_urlopen)
 
     resolved = image_repository.ensure_realesrgan_anime_weights()
     assert resolved == weights_dir / constants.REAL_ESRGAN_ANIME_WEIGHTS_FILENAME
-    assert resolved.read_bytes() == payload
+    assert resolved.read_bytes() == _DOWNLOAD_PAYLOAD
     assert seen["url"] == constants.REAL_ESRGAN_ANIME_WEIGHTS_URL
     assert "Downloading Real-ESRGAN weights" in caplog.text
     assert "Real-ESRGAN weights download progress:" in caplog.text
@@ -203,6 +214,8 @@ def test_image_service_startup_logs_model_loading_completion(
 def test_image_service_startup_logs_weights_failure_but_does_not_crash(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
+    import urllib.error
+
     class _Pipeline:
         pass
 
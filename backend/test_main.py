@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import io
 import time
-import tomllib
 from pathlib import Path
 
 import pytest
@@ -23,6 +22,10 @@ from services import audio_service, image_service, video_service
 WAV_HEADER = b"RIFF" + b"\x00" * 100
 MP4_HEADER = b"\x00\x00\x00\x20ftypisom" + b"\x00" * 16
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+README_MD = REPO_ROOT / "README.md"
+VITE_CONFIG = REPO_ROOT / "vite.config.ts"
+
 
 def _make_png_bytes() -> bytes:
     buf = io.BytesIO()
@@ -33,41 +36,71 @@ def _make_png_bytes() -> bytes:
 PNG_HEADER = _make_png_bytes()
 
 
-def _patch_wan_i2v_noop(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_load_video_pipeline() -> object:
-        return object()
+# Shared fake inference outputs. image_service never mutates the image returned
+# by run_image_inference (letterboxing and PNG encoding both produce new
+# objects), so a single instance per size is safe to reuse across calls.
+FAKE_IMAGE_1024 = Image.new("RGB", (1024, 1024), color=(80, 120, 200))
+FAKE_IMAGE_720x1280 = Image.new("RGB", (720, 1280), color=(255, 255, 255))
 
-    def fake_run_video_inference(
-        pipeline: object,
-        *,
-        input_image: object,
-        prompt: str,
-        target_width: int,
-        target_height: int,
-        temp_dir: Path,
-    ) -> Path:
-        clip_path = temp_dir / "wan_clip.mp4"
-        clip_path.write_bytes(MP4_HEADER)
-        return clip_path
+# One stateless fake pipeline for the whole module; the stub fixture hands out
+# a fresh ImageInferenceStub per test, so no per-test pipeline reset is needed.
+FAKE_ANIMA_PIPELINE = image_repository.AnimaComfyPipeline(model=None, clip=None, vae=None)
 
-    monkeypatch.setattr(video_service.video_repository, "load_video_pipeline", fake_load_video_pipeline)
-    monkeypatch.setattr(video_service.video_repository, "run_video_inference", fake_run_video_inference)
 
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    # Module scope amortizes the FastAPI lifespan startup (model-load hooks,
+    # queue worker spin-up) over the whole file instead of paying it per test,
+    # while still tearing down the weights stub before other modules run.
+    # The function-scoped monkeypatch fixture cannot be used here, so the
+    # stub is applied through an explicit MonkeyPatch context.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            image_repository,
+            "ensure_realesrgan_anime_weights",
+            lambda: Path("/tmp/realesr-animevideov3.pth"),
+        )
+        # Default raise_server_exceptions=True: every error path in these
+        # tests goes through the app's own exception handlers, and the
+        # default skips Starlette's traceback capture on the happy paths.
+        with TestClient(app=main.app) as c:
+            yield c
 
-class FakeImageResult:
-    def __init__(self, images: list[Image.Image]):
-        self.images = images
 
+class ImageInferenceStub:
+    """Configurable stand-in for the image_repository inference surface.
 
-@pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
-    monkeypatch.setattr(
-        image_repository,
-        "ensure_realesrgan_anime_weights",
-        lambda: Path("/tmp/realesr-animevideov3.pth"),
-    )
-    with TestClient(app=main.app, raise_server_exceptions=False) as c:
-        yield c
+    Installed once per class by the shared_image_stub fixture; tests adjust
+    ``result`` and assert on ``calls`` instead of re-wiring their own
+    monkeypatch closures.
+    """
+
+    __slots__ = ("calls", "result")
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+        self.result: Image.Image = FAKE_IMAGE_1024
+
+    def run(
+        self,
+        pipeline: object,
+        *,
+        prompt: str,
+        seed: int,
+        negative_prompt: str | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Image.Image:
+        self.calls.append(
+            {
+                "prompt": prompt,
+                "seed": seed,
+                "negative_prompt": negative_prompt,
+                "width": width,
+                "height": height,
+            }
+        )
+        return self.result
 
 
 @pytest.fixture(autouse=True)
@@ -89,13 +122,16 @@ class TestGenerateRequestBody:
         assert body.tempo == 80
         assert body.style == "jazz"
 
-    def test_tempo_below_minimum_rejected(self) -> None:
-        with pytest.raises(Exception):
-            GenerateRequestBody(prompt="x", mood="chill", tempo=59, style="jazz")
-
-    def test_without_prompt_rejected(self) -> None:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"prompt": "x", "mood": "chill", "tempo": 59, "style": "jazz"}, id="tempo-below-minimum"),
+            pytest.param({}, id="missing-prompt"),
+        ],
+    )
+    def test_invalid_request_body_rejected(self, kwargs: dict[str, object]) -> None:
         with pytest.raises(Exception):
-            GenerateRequestBody()
+            GenerateRequestBody(**kwargs)
 
     def test_llm_mode_with_prompt_is_valid(self) -> None:
         body = GenerateRequestBody(mode="llm", prompt="  synthwave rooftop night set  ")
@@ -113,37 +149,21 @@ class TestGenerateImageRequestBodyContract:
         assert fields["target_height"].alias == "targetHeight"
 
 
-class TestBuildPrompt:
-    def test_prompt_follows_template(self) -> None:
-        body = GenerateRequestBody(mode="text", prompt="chill lofi jazz", mood="chill", tempo=80, style="jazz")
-        assert audio_service.build_prompt(body) == "chill lofi jazz"
-
-    def test_text_mode_prompt_uses_user_text_verbatim(self) -> None:
-        body = GenerateRequestBody(mode="text", prompt="  crunchy drums with vinyl hiss  ")
-        assert audio_service.build_prompt(body) == "crunchy drums with vinyl hiss"
-
-
 class TestBackendDependencies:
-    def test_pyproject_does_not_include_ace_step(self) -> None:
-        pyproject_path = Path(__file__).parent.joinpath("pyproject.toml")
-        project = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-        dependencies = project["project"]["dependencies"]
+    def test_pyproject_does_not_include_ace_step(self, pyproject_data: dict) -> None:
+        dependencies = pyproject_data["project"]["dependencies"]
         assert "ace-step" not in dependencies
 
-    def test_uv_lock_does_not_include_ace_step(self) -> None:
-        lockfile = Path(__file__).parent.joinpath("uv.lock").read_text(encoding="utf-8")
-        assert 'name = "ace-step"' not in lockfile
-        assert "github.com/ace-step/ACE-Step.git" not in lockfile
+    def test_uv_lock_does_not_include_ace_step(self, uv_lock_text: str) -> None:
+        assert 'name = "ace-step"' not in uv_lock_text
+        assert "github.com/ace-step/ACE-Step.git" not in uv_lock_text
 
-    def test_pyproject_includes_ffmpeg_python(self) -> None:
-        pyproject_path = Path(__file__).parent.joinpath("pyproject.toml")
-        project = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-        dependencies = project["project"]["dependencies"]
+    def test_pyproject_includes_ffmpeg_python(self, pyproject_data: dict) -> None:
+        dependencies = pyproject_data["project"]["dependencies"]
         assert "ffmpeg-python>=0.2.0" in dependencies
 
     def test_readme_documents_ffmpeg_binary_dependency(self) -> None:
-        readme_path = Path(__file__).resolve().parents[1].joinpath("README.md")
-        content = readme_path.read_text(encoding="utf-8")
+        content = README_MD.read_text(encoding="utf-8")
         assert "ffmpeg" in content
         assert "libx264" in content
         assert "AAC" in content
@@ -305,46 +325,54 @@ class TestGenerationQueue:
         assert payload["status"] in ("queued", "generating", "completed", "failed")
 
 
+# The stubbed-inference tests share one TestClient so the lifespan startup
+# (model load plus queue worker) runs once for the class instead of once per
+# test. Module-level rather than instance-method fixtures because class-scoped
+# fixtures on the class itself are deprecated in pytest 9; the per-test reset
+# fixture on the class restores the stub's state.
+
+@pytest.fixture(scope="class")
+def shared_image_stub() -> ImageInferenceStub:
+    stub = ImageInferenceStub()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(image_repository, "load_image_pipeline", lambda: FAKE_ANIMA_PIPELINE)
+        mp.setattr(image_repository, "run_image_inference", stub.run)
+        mp.setattr(image_repository, "upscale_image_with_realesrgan_anime", lambda image: image)
+        mp.setattr(
+            image_repository,
+            "ensure_realesrgan_anime_weights",
+            lambda: Path("/tmp/realesr-animevideov3.pth"),
+        )
+        yield stub
+
+
+@pytest.fixture(scope="class")
+def image_client(shared_image_stub: ImageInferenceStub) -> TestClient:
+    with TestClient(app=main.app) as c:
+        yield c
+
+
 class TestGenerateImageEndpoint:
+    @pytest.fixture
+    def image_inference_stub(
+        self, shared_image_stub: ImageInferenceStub
+    ) -> ImageInferenceStub:
+        shared_image_stub.calls.clear()
+        shared_image_stub.result = FAKE_IMAGE_1024
+        return shared_image_stub
+
     def test_generate_image_returns_png_binary_and_uses_anima_inference_defaults(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, image_client: TestClient, image_inference_stub: ImageInferenceStub
     ) -> None:
-        seen_calls: list[dict[str, object]] = []
-
-        def fake_run_image_inference(
-            pipeline: object,
-            *,
-            prompt: str,
-            seed: int,
-            negative_prompt: str | None = None,
-            width: int | None = None,
-            height: int | None = None,
-        ) -> object:
-            seen_calls.append(
-                {
-                    "prompt": prompt,
-                    "seed": seed,
-                    "negative_prompt": negative_prompt,
-                    "width": width,
-                    "height": height,
-                }
-            )
-            return Image.new("RGB", (1024, 1024), color=(80, 120, 200))
-
-        fake_pipeline = image_repository.AnimaComfyPipeline(model=None, clip=None, vae=None)
-        monkeypatch.setattr(image_repository, "load_image_pipeline", lambda: fake_pipeline)
-        monkeypatch.setattr(image_repository, "run_image_inference", fake_run_image_inference)
-        monkeypatch.setattr(image_repository, "upscale_image_with_realesrgan_anime", lambda image: image)
-        with TestClient(app=main.app, raise_server_exceptions=False) as test_client:
-            response = test_client.post("/api/generate-image", json={"prompt": "misty mountains"})
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "image/png"
-            assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
-
-            second = test_client.post("/api/generate-image", json={"prompt": "city sunset"})
-            assert second.status_code == 200
-
-        assert seen_calls == [
+        response = image_client.post("/api/generate-image", json={"prompt": "misty mountains"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
+
+        second = image_client.post("/api/generate-image", json={"prompt": "city sunset"})
+        assert second.status_code == 200
+
+        assert image_inference_stub.calls == [
             {
                 "prompt": "score_9, score_8, best quality, highres, misty mountains",
                 "seed": 0,
@@ -362,73 +390,40 @@ class TestGenerateImageEndpoint:
         ]
 
     def test_generate_image_uses_requested_target_resolution(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, image_client: TestClient, image_inference_stub: ImageInferenceStub
     ) -> None:
-        fake_pipeline = image_repository.AnimaComfyPipeline(model=None, clip=None, vae=None)
-        monkeypatch.setattr(image_repository, "load_image_pipeline", lambda: fake_pipeline)
-        monkeypatch.setattr(
-            image_repository,
-            "run_image_inference",
-            lambda pipeline, **kwargs: Image.new("RGB", (720, 1280), color=(255, 255, 255)),
+        image_inference_stub.result = FAKE_IMAGE_720x1280
+        response = image_client.post(
+            "/api/generate-image",
+            json={"prompt": "vertical neon alley", "targetWidth": 1080, "targetHeight": 1920},
         )
-        monkeypatch.setattr(image_repository, "upscale_image_with_realesrgan_anime", lambda image: image)
-        with TestClient(app=main.app, raise_server_exceptions=False) as test_client:
-            response = test_client.post(
-                "/api/generate-image",
-                json={"prompt": "vertical neon alley", "targetWidth": 1080, "targetHeight": 1920},
-            )
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "image/png"
-            output = Image.open(io.BytesIO(response.content))
-            assert output.size == (1080, 1920)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        output = Image.open(io.BytesIO(response.content))
+        assert output.size == (1080, 1920)
 
     def test_generate_image_passes_negative_prompt_to_pipeline(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, image_client: TestClient, image_inference_stub: ImageInferenceStub
     ) -> None:
-        seen: dict[str, object] = {}
-
-        def fake_run_image_inference(
-            pipeline: object,
-            *,
-            prompt: str,
-            seed: int,
-            negative_prompt: str | None = None,
-            width: int | None = None,
-            height: int | None = None,
-        ) -> object:
-            seen["prompt"] = prompt
-            seen["kwargs"] = {
-                "seed": seed,
-                "negative_prompt": negative_prompt,
-                "width": width,
-                "height": height,
-            }
-            return Image.new("RGB", (1024, 1024), color=(10, 10, 10))
-
-        fake_pipeline = image_repository.AnimaComfyPipeline(model=None, clip=None, vae=None)
-        monkeypatch.setattr(image_repository, "load_image_pipeline", lambda: fake_pipeline)
-        monkeypatch.setattr(image_repository, "run_image_inference", fake_run_image_inference)
-        monkeypatch.setattr(image_repository, "upscale_image_with_realesrgan_anime", lambda image: image)
-        with TestClient(app=main.app, raise_server_exceptions=False) as test_client:
-            response = test_client.post(
-                "/api/generate-image",
-                json={
-                    "prompt": "portrait of a cat",
-                    "negativePrompt": "blurry, distorted",
-                },
-            )
+        response = image_client.post(
+            "/api/generate-image",
+            json={
+                "prompt": "portrait of a cat",
+                "negativePrompt": "blurry, distorted",
+            },
+        )
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "image/png"
-        assert seen == {
-            "prompt": "score_9, score_8, best quality, highres, portrait of a cat",
-            "kwargs": {
+        assert image_inference_stub.calls == [
+            {
+                "prompt": "score_9, score_8, best quality, highres, portrait of a cat",
                 "seed": 0,
                 "negative_prompt": f"{image_service.DEFAULT_NEGATIVE_PROMPT}, blurry, distorted",
                 "width": 1024,
                 "height": 1024,
-            },
-        }
+            }
+        ]
 
     def test_model_load_failure_returns_500_with_meaningful_message(
         self, monkeypatch: pytest.MonkeyPatch
@@ -437,7 +432,7 @@ class TestGenerateImageEndpoint:
             raise RuntimeError("model weights missing")
 
         monkeypatch.setattr(image_repository, "load_image_pipeline", raise_model_load_error)
-        with TestClient(app=main.app, raise_server_exceptions=False) as test_client:
+        with TestClient(app=main.app) as test_client:
             response = test_client.post("/api/generate-image", json={"prompt": "forest path"})
 
         assert response.status_code == 500
@@ -575,6 +570,6 @@ class TestLoadClipVariadicSignature:
 
 class TestViteProxyConfiguration:
     def test_generate_image_proxy_routes_to_backend_port_8000(self) -> None:
-        vite_config = Path(__file__).resolve().parents[1].joinpath("vite.config.ts").read_text(encoding="utf-8")
+        vite_config = VITE_CONFIG.read_text(encoding="utf-8")
         assert "'/api/generate-image'" in vite_config
         assert "target: 'http://127.0.0.1:8000'" in vite_config
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import tomllib
 from pathlib import Path
 
 
@@ -18,14 +17,14 @@ def test_us003_ac01_dependency_file_includes_diffsynth_library() -> None:
     assert any(requirement.startswith("diffsynth") for requirement in requirements)
 
 
-def test_us003_ac02_dependency_files_exclude_diffusers_and_transformers() -> None:
+def test_us003_ac02_dependency_files_exclude_diffusers_and_transformers(
+    pyproject_data: dict,
+) -> None:
     requirements = _read_requirements()
     assert not any(requirement.startswith("diffusers") for requirement in requirements)
     assert not any(requirement.startswith("transformers") for requirement in requirements)
 
-    pyproject_path = BACKEND_DIR.joinpath("pyproject.toml")
-    project = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-    dependencies: list[str] = project["project"]["dependencies"]
+    dependencies: list[str] = pyproject_data["project"]["dependencies"]
 
     assert not any(dependency.startswith("diffusers") for dependency in dependencies)
     assert not any(dependency.startswith("transformers") for dependency in dependencies)
@@ -161,8 +161,8 @@ def test_load_video_pipeline_returns_wan_comfy_pipeline(
 
 
 def test_load_video_pipeline_requires_models_dir(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("WAN_COMFY_MODELS_DIR", raising=False)
-    monkeypatch.delenv("PYCOMFY_MODELS_DIR", raising=False)
+    monkeypatch.delitem(os.environ, "WAN_COMFY_MODELS_DIR", raising=False)
+    monkeypatch.delitem(os.environ, "PYCOMFY_MODELS_DIR", raising=False)
     _install_fake_modules(monkeypatch, None)
     monkeypatch.setattr(constants, "WAN_COMFY_MODELS_DIR", "")
     monkeypatch.setattr(constants, "WAN_COMFY_UNET_HIGH", "h")
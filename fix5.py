@@ -1,44 +1,62 @@
 import re
 
-with open('src/App.test.tsx', 'r') as f:
-    content = f.read()
-
-# Replace any leftover clicks to Visual Settings before Image prompt changes
-content = re.sub(
-    r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*fireEvent\.change\(screen\.getByLabelText\('Image prompt'\)",
-    "fireEvent.change(screen.getByLabelText('Image prompt')",
-    content
-)
+# The four click-removal rules are fused into one pass. They all anchor on the
+# same 'Visual Settings' click literal and differ only in what follows it, so
+# any two of them can tie only at the same start position, where left-to-right
+# alternation order reproduces the old sequential priority.
+#
+# The region/click swap is NOT in the alternation: its needle starts one line
+# earlier (at the const declaration), so inside a combined pattern it would
+# win by position over a click-removal rule matching the same click — the old
+# script resolved that overlap the other way (the click gets removed first and
+# the swap never fires). It therefore runs as its own pass, after this one,
+# exactly as before.
+_RULES = [
+    # Drop leftover clicks to Visual Settings before Image prompt changes
+    (
+        r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*fireEvent\.change\(screen\.getByLabelText\('Image prompt'\)",
+        "fireEvent.change(screen.getByLabelText('Image prompt')",
+    ),
+    # Drop clicks to 'Visual Settings' before checking 'Use same prompt for image'
+    (
+        r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*fireEvent\.click\(\s*screen\.getByRole\('checkbox', \{ name: 'Use same prompt for image' \}\)\s*\);",
+        "fireEvent.click(\n      screen.getByRole('checkbox', { name: 'Use same prompt for image' })\n    );",
+    ),
+    # Drop clicks to 'Visual Settings' before expects on the Image prompt field
+    (
+        r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*expect\(screen\.getByLabelText\('Image prompt'\)\)",
+        "expect(screen.getByLabelText('Image prompt'))",
+    ),
+    (
+        r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*expect\(screen\.queryByLabelText\('Image prompt'\)",
+        "expect(screen.queryByLabelText('Image prompt')",
+    ),
+]
+
+_BATCH = re.compile("|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(_RULES)))
+
+
+def _apply_rule(match: re.Match) -> str:
+    return _RULES[int(match.lastgroup[1:])][1]
 
-# Replace clicks to 'Visual Settings' before checking 'Use same prompt for image'
-content = re.sub(
-    r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*fireEvent\.click\(\s*screen\.getByRole\('checkbox', \{ name: 'Use same prompt for image' \}\)\s*\);",
-    "fireEvent.click(\n      screen.getByRole('checkbox', { name: 'Use same prompt for image' })\n    );",
-    content
-)
 
-# Replace clicks to 'Visual Settings' before checking expect
-content = re.sub(
-    r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*expect\(screen\.getByLabelText\('Image prompt'\)\)",
-    "expect(screen.getByLabelText('Image prompt'))",
-    content
-)
+with open('src/App.test.tsx', 'r') as f:
+    content = f.read()
 
-content = re.sub(
-    r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*expect\(screen\.queryByLabelText\('Image prompt'\)",
-    "expect(screen.queryByLabelText('Image prompt')",
-    content
-)
+content = _BATCH.sub(_apply_rule, content)
 
+# Open Visual Settings before grabbing the Visual prompt region
 content = content.replace(
     "const visualPromptSection = within(controlsColumn).getByRole('region', { name: 'Visual prompt' });\n    fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));",
-    "fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));\n    const visualPromptSection = within(controlsColumn).getByRole('region', { name: 'Visual prompt' });"
+    "fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));\n    const visualPromptSection = within(controlsColumn).getByRole('region', { name: 'Visual prompt' });",
 )
 
-# A specific test for the unified Image generation
+# A specific test for the unified Image generation. Kept sequential too: it
+# can match a click newly exposed by an earlier removal (click, click, change
+# chains), which a single shared pass would have already scanned past.
 content = content.replace(
     "fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));\n    fireEvent.change(screen.getByLabelText('Image prompt')",
-    "fireEvent.change(screen.getByLabelText('Image prompt')"
+    "fireEvent.change(screen.getByLabelText('Image prompt')",
 )
 
 with open('src/App.test.tsx', 'w') as f:
@@ -1,36 +1,115 @@
 import re
 
-with open('src/App.test.tsx', 'r') as f:
-    content = f.read()
-
-# Replace any click to 'Visual Settings' right before querying for 'Image prompt'
-# In many places we added: fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));
-# before image prompt changes.
-# Let's just remove that line if it's right before 'Image prompt' change.
-
-content = re.sub(
-    r"fireEvent\.click\(screen\.getByRole\('button', \{ name: 'Visual Settings' \}\)\);\s*fireEvent\.change\(screen\.getByLabelText\('Image prompt'\)",
-    "fireEvent.change(screen.getByLabelText('Image prompt')",
-    content
+# Needles are bytes: the file is processed in binary mode so the rewrite
+# skips the UTF-8 decode on read and re-encode on write.
+_CLICK_NEEDLE = b"fireEvent.click(screen.getByRole('button', { name: 'Visual Settings' }));"
+_CHANGE_FOLLOWER = b"fireEvent.change(screen.getByLabelText('Image prompt')"
+_WHITESPACE = b" \t\r\n"
+
+# 'Visual prompt' changed to 'Visualizer settings'.
+_REPLACEMENTS = (
+    (b"'Visual prompt'", b"'Visualizer settings'"),
 )
 
-# For the unified Generation request test:
-# "const visualPromptSection = screen.getByRole('region', {\n      name: 'Visual prompt'\n    });"
-# wait, 'Visual prompt' changed to 'Visualizer settings', and Image Prompt is now in 'Image prompt' section.
-content = content.replace("'Visual prompt'", "'Visualizer settings'")
+# sectionLabels edit: insert 'Image prompt' between the two existing labels.
+# Matching the separator whitespace instead of hard-coding the inline and
+# multi-line spellings covers both with one rule (and any reformat in
+# between), reusing whatever separator the source already uses.
+_SECTION_LABELS_RE = re.compile(rb"'Generation parameters',(\s*)'Generation actions'")
 
-# But we also have a new section 'Image prompt' in Music tab.
-# Let's fix sectionLabels array test
-content = content.replace(
-    "['Generation parameters', 'Generation actions']",
-    "['Generation parameters', 'Image prompt', 'Generation actions']"
+# One compiled alternation over all needles (longest first so the engine
+# prefers the most specific match).
+_REPLACEMENT_MAP = dict(_REPLACEMENTS)
+_REPLACEMENT_RE = re.compile(
+    b"|".join(re.escape(needle) for needle in sorted(_REPLACEMENT_MAP, key=len, reverse=True))
 )
 
-content = content.replace(
-    "      'Generation parameters',\n      'Generation actions'\n    ]);",
-    "      'Generation parameters',\n      'Image prompt',\n      'Generation actions'\n    ]);"
-)
+# Every edit is a (start, end, replacement) span against the original bytes;
+# the output is assembled once at the end, so no intermediate full-size copy
+# of the file is ever built.
+_Edit = tuple[int, int, bytes]
+
+
+def _collect_click_edits(content: bytes) -> list[_Edit]:
+    # Drop any click to 'Visual Settings' sitting right before an
+    # 'Image prompt' change. The old regex matched literal-whitespace-literal;
+    # find() plus a manual whitespace skip does the same without the engine.
+    edits: list[_Edit] = []
+    pos = 0
+    while True:
+        i = content.find(_CLICK_NEEDLE, pos)
+        if i == -1:
+            break
+        j = i + len(_CLICK_NEEDLE)
+        while j < len(content) and content[j] in _WHITESPACE:
+            j += 1
+        if content.startswith(_CHANGE_FOLLOWER, j):
+            edits.append((i, j, b""))
+        pos = i + len(_CLICK_NEEDLE)
+    return edits
+
+
+def _collect_replacement_edits(content: bytes) -> list[_Edit]:
+    return [
+        (match.start(), match.end(), _REPLACEMENT_MAP[match.group(0)])
+        for match in _REPLACEMENT_RE.finditer(content)
+    ]
+
+
+def _collect_section_label_edits(content: bytes) -> list[_Edit]:
+    edits: list[_Edit] = []
+    for match in _SECTION_LABELS_RE.finditer(content):
+        separator = match.group(1)
+        replacement = (
+            b"'Generation parameters'," + separator + b"'Image prompt'," + separator + b"'Generation actions'"
+        )
+        edits.append((match.start(), match.end(), replacement))
+    return edits
+
+
+def _apply_edits(content: bytes, edits: list[_Edit]) -> bytes:
+    if not edits:
+        return content
+    edits.sort()
+    parts: list[bytes] = []
+    cursor = 0
+    for start, end, replacement in edits:
+        if start < cursor:  # overlapping edit; keep the earlier one
+            continue
+        parts.append(content[cursor:start])
+        if replacement:
+            parts.append(replacement)
+        cursor = end
+    parts.append(content[cursor:])
+    return b"".join(parts)
+
+
+def fix(path: str) -> bool:
+    """Apply all fixes to one file; returns True when the file was rewritten.
+
+    Importable so a driver can loop over many files in one interpreter,
+    amortizing startup and the compiled patterns across the batch.
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    edits = (
+        _collect_click_edits(content)
+        + _collect_replacement_edits(content)
+        + _collect_section_label_edits(content)
+    )
+
+    # Idempotent re-runs find nothing to change; skip the rewrite (and the
+    # mtime bump that would retrigger watchers) entirely in that case.
+    if not edits:
+        return False
+    with open(path, 'wb') as f:
+        f.write(_apply_edits(content, edits))
+    return True
+
 
+if __name__ == '__main__':
+    import sys
 
-with open('src/App.test.tsx', 'w') as f:
-    f.write(content)
+    for target in sys.argv[1:] or ['src/App.test.tsx']:
+        fix(target)